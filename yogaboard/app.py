@@ -0,0 +1,310 @@
+"""GTK application class for the yogaboard virtual keyboard.
+
+Importing this module loads libgtk4-layer-shell and GTK itself, so it is
+only imported from main() when the GUI is actually about to run.
+"""
+
+from ctypes import CDLL
+
+# Must load layer-shell before importing GTK
+CDLL("libgtk4-layer-shell.so.0")
+
+import gi
+
+gi.require_version("Gtk", "4.0")
+gi.require_version("Gtk4LayerShell", "1.0")
+from gi.repository import Gtk, Gio
+
+from yogaboard.ui.window import KeyboardWindow
+from yogaboard.ui.keyboard_widget import KeyboardWidget
+from yogaboard.ui.touchpad_widget import TouchpadWidget
+from yogaboard.layout.parser import LayoutParser
+from yogaboard.input_device.uinput_keyboard import UInputKeyboard
+from yogaboard.input_device.uinput_touchpad import UInputTouchpad
+from yogaboard.input.touch_handler import TouchHandler
+from yogaboard.input.touchpad_handler import TouchpadHandler
+from yogaboard.input.modifier_state import ModifierState
+from yogaboard.settings import SettingsManager
+import os
+
+# Resource locations, resolved once at import time. importlib.resources
+# doesn't fit: layouts/ and resources/ deliberately live outside the
+# package directory (see package-data in pyproject.toml), so plain
+# filesystem paths relative to this file are the source of truth.
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_QWERTY_LAYOUT_PATH = os.path.join(_PACKAGE_DIR, "../layouts/qwerty.json")
+_SLIM_LAYOUT_PATH = os.path.join(_PACKAGE_DIR, "../layouts/slim.json")
+_COMPACT_LAYOUT_PATH = os.path.join(_PACKAGE_DIR, "../layouts/qwerty-compact.json")
+_STYLE_CSS_PATH = os.path.join(_PACKAGE_DIR, "../resources/style.css")
+_THEMES_DIR = os.path.join(_PACKAGE_DIR, "../resources/themes")
+
+
+class KeyboardApp(Gtk.Application):
+    """Main GTK application for yogaboard virtual keyboard."""
+
+    MODE_KEYBOARD = "keyboard"
+    MODE_SLIM = "slim"
+    MODE_FULL = "full"  # Keyboard + touchpad below (full height)
+    MODE_SMALL = "small"  # Keyboard + touchpad to the right
+
+    def __init__(self):
+        super().__init__(application_id="org.aeracode.yogaboard")
+        self.current_mode = self.MODE_SLIM
+        self.window = None
+        self.keyboard_widget = None
+        self.touchpad_widget = None
+        # None until do_activate builds them; do_shutdown checks these
+        # sentinels so a failed half-initialized startup still cleans up
+        self.touch_handler = None
+        self.touchpad_handler = None
+        self.uinput_keyboard = None
+        self.uinput_touchpad = None
+        # Widget trees cached per mode: built on first visit, then mode
+        # switches are just set_child() with no widget construction
+        self._mode_children = {}
+        self.settings_manager = SettingsManager()
+        self.settings_dialog = None
+        self.base_css_provider = None
+        self.theme_css_provider = None
+
+        # "Close" only hides the window (see hide_window); this action is
+        # the path that really exits, reachable remotely via
+        # `gapplication action org.aeracode.yogaboard quit`
+        quit_action = Gio.SimpleAction.new("quit", None)
+        quit_action.connect("activate", lambda action, param: self.quit())
+        self.add_action(quit_action)
+
+    def do_activate(self):
+        """Initialize and show the virtual keyboard."""
+        # A second activation (e.g. launching again while running) just
+        # re-presents the window - devices, layouts and the parsed CSS
+        # providers are built exactly once per process
+        if self.window is not None:
+            self.window.present()
+            return
+
+        try:
+            # Load settings
+            self.settings_manager.load()
+
+            # Initialize uinput virtual keyboard
+            self.uinput_keyboard = UInputKeyboard()
+
+            # Load layouts
+            qwerty_layout = LayoutParser.load(_QWERTY_LAYOUT_PATH)
+            slim_layout = LayoutParser.load(_SLIM_LAYOUT_PATH)
+            compact_layout = LayoutParser.load(_COMPACT_LAYOUT_PATH)
+
+            self.layouts = {
+                self.MODE_KEYBOARD: qwerty_layout,
+                self.MODE_SLIM: slim_layout,
+                self.MODE_SMALL: compact_layout,
+            }
+
+            # Create main window
+            self.window = KeyboardWindow(self)
+
+            # Setup touch handling with app reference
+            self.touch_handler = TouchHandler(self.uinput_keyboard, app=self)
+
+            # Initialize uinput virtual touchpad
+            self.uinput_touchpad = UInputTouchpad()
+            self.touchpad_handler = TouchpadHandler(
+                self.uinput_touchpad, app=self, settings_manager=self.settings_manager
+            )
+
+            # Load base CSS styling
+            self.base_css_provider = Gtk.CssProvider()
+            self.base_css_provider.load_from_path(_STYLE_CSS_PATH)
+            Gtk.StyleContext.add_provider_for_display(
+                self.window.get_display(),
+                self.base_css_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+            )
+
+            # Load theme CSS (on top of base)
+            self.theme_css_provider = Gtk.CssProvider()
+            self._apply_theme(self.settings_manager.appearance.color_scheme)
+
+            # Register for settings changes
+            self.settings_manager.add_change_callback(self._on_settings_changed)
+
+            # Start in slim mode
+            self.switch_to_layout(self.MODE_SLIM)
+
+            self.window.present()
+
+        except Exception as e:
+            print(f"Error starting yogaboard: {e}")
+            import traceback
+
+            traceback.print_exc()
+            self.quit()
+
+    def toggle_mode(self):
+        """Cycle between keyboard, slim, full, and small modes."""
+        if self.current_mode == self.MODE_KEYBOARD:
+            self.switch_to_layout(self.MODE_SLIM)
+        elif self.current_mode == self.MODE_SLIM:
+            self.switch_to_full()
+        elif self.current_mode == self.MODE_FULL:
+            self.switch_to_small()
+        else:
+            self.switch_to_layout(self.MODE_KEYBOARD)
+
+    def _build_mode_child(self, mode):
+        """Build the widget tree for a mode.
+
+        Returns:
+            (root_child, keyboard_widget, touchpad_widget) - touchpad_widget
+            is None for keyboard-only modes
+        """
+        if mode == self.MODE_FULL:
+            # Vertical container: keyboard (QWERTY layout) + touchpad below
+            container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
+
+            keyboard_widget = KeyboardWidget(self.layouts[self.MODE_KEYBOARD])
+            container.append(keyboard_widget)
+
+            # Touchpad below (no controls - keyboard has them)
+            # Constrain to ~1/3 screen width, aligned to the right
+            touchpad_widget = TouchpadWidget(show_controls=False)
+            touchpad_widget.set_vexpand(True)
+            touchpad_widget.set_hexpand(False)
+            touchpad_widget.set_halign(Gtk.Align.CENTER)
+            touchpad_widget.set_size_request(700, 400)  # ~1/3 of typical screen width
+            container.append(touchpad_widget)
+
+            return container, keyboard_widget, touchpad_widget
+
+        if mode == self.MODE_SMALL:
+            # Horizontal container: compact keyboard + touchpad to the right
+            container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
+
+            keyboard_widget = KeyboardWidget(self.layouts[self.MODE_SMALL])
+            container.append(keyboard_widget)
+
+            # Touchpad to the right (no controls - keyboard has them)
+            touchpad_widget = TouchpadWidget(show_controls=False)
+            touchpad_widget.set_size_request(300, -1)  # Fixed width for touchpad
+            container.append(touchpad_widget)
+
+            return container, keyboard_widget, touchpad_widget
+
+        keyboard_widget = KeyboardWidget(self.layouts[mode])
+        return keyboard_widget, keyboard_widget, None
+
+    def _set_mode_child(self, mode):
+        """Show the (cached) widget tree for a mode, building it on first use."""
+        cached = self._mode_children.get(mode)
+        is_new = cached is None
+        if is_new:
+            cached = self._mode_children[mode] = self._build_mode_child(mode)
+        child, keyboard_widget, touchpad_widget = cached
+
+        self.keyboard_widget = keyboard_widget
+        self.touchpad_widget = touchpad_widget
+        self.window.set_child(child)
+
+        # Gestures are attached exactly once per widget tree - attaching on
+        # every switch would pile duplicate controllers onto cached widgets.
+        # Done after set_child so the widgets have a native surface.
+        if is_new:
+            self.touch_handler.setup_gestures(keyboard_widget)
+            if touchpad_widget is not None:
+                self.touchpad_handler.setup_gestures(touchpad_widget)
+
+    def switch_to_layout(self, mode):
+        """Switch to a specific layout mode."""
+        self.current_mode = mode
+        layout = self.layouts[mode]
+
+        # Use window height from layout, or fallback to 400px
+        height = layout.window_height if layout.window_height else 400
+
+        # Update window height
+        self.window.set_default_size(-1, height)
+        self.window.toggle_full(False)
+
+        self._set_mode_child(mode)
+
+    def switch_to_full(self):
+        """Switch to full mode: keyboard + touchpad below, full screen height."""
+        self.current_mode = self.MODE_FULL
+        self.window.toggle_full(True)
+
+        # Full screen height (use a large value, layer shell will constrain it)
+        self.window.set_default_size(-1, 1000)
+
+        self._set_mode_child(self.MODE_FULL)
+
+    def switch_to_small(self):
+        """Switch to small mode: compact keyboard + touchpad to the right."""
+        self.current_mode = self.MODE_SMALL
+        self.window.toggle_full(False)
+
+        layout = self.layouts[self.MODE_SMALL]
+        height = layout.window_height if layout.window_height else 200
+        self.window.set_default_size(-1, height)
+
+        self._set_mode_child(self.MODE_SMALL)
+
+    def hide_window(self):
+        """Hide the keyboard instead of quitting.
+
+        The widget tree and layer-shell surface stay alive, so re-showing
+        (activating the app again re-presents the window) skips rebuilding
+        and re-styling the whole key grid.
+        """
+        self.window.set_visible(False)
+
+    def open_settings(self):
+        """Open the settings dialog, building it only on the first use."""
+        if self.settings_dialog is None:
+            from yogaboard.ui.settings_dialog import SettingsDialog
+
+            self.settings_dialog = SettingsDialog(self, self.settings_manager)
+        else:
+            self.settings_dialog.refresh()
+        self.settings_dialog.present()
+
+    def _apply_theme(self, theme_id: str):
+        """Apply a color scheme theme."""
+        display = self.window.get_display()
+
+        # Remove existing theme provider if present
+        if self.theme_css_provider is not None:
+            Gtk.StyleContext.remove_provider_for_display(display, self.theme_css_provider)
+
+        # Create new provider and load theme
+        self.theme_css_provider = Gtk.CssProvider()
+
+        if theme_id != "default":
+            theme_path = os.path.join(_THEMES_DIR, f"{theme_id}.css")
+            if os.path.exists(theme_path):
+                self.theme_css_provider.load_from_path(theme_path)
+
+        # Add at higher priority than base (so it overrides)
+        Gtk.StyleContext.add_provider_for_display(
+            display,
+            self.theme_css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1,
+        )
+
+    def _on_settings_changed(self, settings: SettingsManager):
+        """Handle settings changes including theme updates."""
+        self._apply_theme(settings.appearance.color_scheme)
+
+    def do_shutdown(self):
+        """Cleanup when application is closing."""
+        if self.touch_handler is not None:
+            self.touch_handler.cleanup()
+        if self.touchpad_handler is not None:
+            self.touchpad_handler.cleanup()
+        if self.uinput_keyboard is not None:
+            self.uinput_keyboard.cleanup()
+        if self.uinput_touchpad is not None:
+            self.uinput_touchpad.cleanup()
+        # Persist any settings change still waiting on the debounced flush
+        self.settings_manager.flush()
+        Gtk.Application.do_shutdown(self)
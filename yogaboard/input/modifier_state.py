@@ -6,6 +6,8 @@ from typing import Dict
 class ModifierState:
     """Track which modifiers are currently pressed and by which touch."""
 
+    __slots__ = ("_active_modifiers",)
+
     def __init__(self):
         """Initialize modifier state tracker."""
         self._active_modifiers: Dict[str, int] = {}  # {modifier_name: touch_id}
@@ -31,8 +33,14 @@ class ModifierState:
             modifier: Name of modifier to release
             touch_id: ID of the touch attempting to release
         """
-        if self._active_modifiers.get(modifier) == touch_id:
-            del self._active_modifiers[modifier]
+        # Single hash lookup on the common (held) path instead of
+        # .get() followed by __delitem__.
+        modifiers = self._active_modifiers
+        try:
+            if modifiers[modifier] == touch_id:
+                del modifiers[modifier]
+        except KeyError:
+            pass
 
     def is_active(self, modifier: str) -> bool:
         """
@@ -46,11 +54,14 @@ class ModifierState:
         """
         return modifier in self._active_modifiers
 
-    def get_all_active(self) -> set:
+    def get_all_active(self):
         """
-        Get set of all currently active modifiers.
+        Get a view of all currently active modifiers.
+
+        Returns a live dict keys view rather than a set copy, so callers
+        iterating it don't pay for an allocation per call.
 
         Returns:
-            Set of modifier names currently pressed
+            View of modifier names currently pressed
         """
-        return set(self._active_modifiers.keys())
+        return self._active_modifiers.keys()
@@ -9,10 +9,10 @@ from yogaboard.input_device.uinput_keyboard import UInputKeyboard
 from yogaboard.ui.key_button import KeyButton
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk
 
 if TYPE_CHECKING:
-    from yogaboard.main import KeyboardApp
+    from yogaboard.app import KeyboardApp
 
 
 class TouchHandler:
@@ -21,10 +21,23 @@ class TouchHandler:
     to our virtual keyboard.
     """
 
+    __slots__ = ("keyboard", "app", "_special_dispatch")
+
     def __init__(self, uinput_keyboard: UInputKeyboard, app):
         self.keyboard = uinput_keyboard
         self.app: KeyboardApp = app
 
+        # Dispatch table for special keys - one dict lookup per press instead
+        # of walking an if/elif chain of string comparisons.
+        self._special_dispatch = {
+            "SPECIAL_CLOSE": app.hide_window,
+            "SPECIAL_MODE_TOGGLE": lambda: app.switch_to_layout(app.MODE_SLIM),
+            "SPECIAL_MODE_KEYBOARD": lambda: app.switch_to_layout(app.MODE_KEYBOARD),
+            "SPECIAL_MODE_FULL": app.switch_to_full,
+            "SPECIAL_MODE_SMALL": app.switch_to_small,
+            "SPECIAL_SETTINGS": app.open_settings,
+        }
+
     def setup_gestures(self, keyboard_widget):
         """
         Setup touch gesture recognition on each button.
@@ -32,58 +45,60 @@ class TouchHandler:
         Args:
             keyboard_widget: KeyboardWidget containing buttons
         """
+        # Bind the handlers once so every connect() shares the same bound
+        # method object instead of creating one per button
+        press_cb = self._on_button_press
+        release_cb = self._on_button_release
+        cancel_cb = self._on_button_cancel
+
         for btn in keyboard_widget.key_buttons:
             gesture = Gtk.GestureClick.new()
             gesture.set_button(0)  # All buttons/touches
             gesture.set_exclusive(False)  # Allow multiple simultaneous gestures
-            gesture.connect("pressed", self._on_button_press, btn)
-            gesture.connect("released", self._on_button_release, btn)
-            gesture.connect("cancel", self._on_button_cancel, btn)
+            # Run in the capture phase so the handler fires before the
+            # default bubble traversal of the widget hierarchy
+            gesture.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+            gesture.connect("pressed", press_cb, btn)
+            gesture.connect("released", release_cb, btn)
+            gesture.connect("cancel", cancel_cb, btn)
             btn.add_controller(gesture)
 
+        # GTK compresses touch events to one per frame by default; ask the
+        # surface to deliver every event so rapid taps aren't coalesced
+        native = keyboard_widget.get_native()
+        if native is not None:
+            surface = native.get_surface()
+            if surface is not None and hasattr(surface, "set_event_compression"):
+                surface.set_event_compression(False)
+
     def _on_button_press(self, gesture, n_press, x, y, button: KeyButton):
         # Handle special keys that don't go to uinput
-        if button.key.key.startswith("SPECIAL_"):
+        if button.is_special:
             self._handle_special_key(button.key.key)
             return
 
-        # Send the key press
-        key_code = button.key.get_uinput_key()
-        self.keyboard.send_key(key_code, pressed=True)
+        # Send the key press (code pre-resolved by KeyButton)
+        self.keyboard.send_key(button.uinput_code, pressed=True)
 
     def _on_button_release(self, gesture, n_press, x, y, button: KeyButton):
-        # Special keys don't need release events
-        if button.key.key.startswith("SPECIAL_"):
-            return
-
-        # Send key release
-        key_code = button.key.get_uinput_key()
-        self.keyboard.send_key(key_code, pressed=False)
+        self._finish_touch(button)
 
     def _on_button_cancel(self, gesture, sequence, button: KeyButton):
+        self._finish_touch(button)
+
+    def _finish_touch(self, button: KeyButton):
+        """Send the key release for a finished or cancelled touch."""
         # Special keys don't need release events
-        if button.key.key.startswith("SPECIAL_"):
+        if button.is_special:
             return
 
-        # Send key release
-        key_code = button.key.get_uinput_key()
-        self.keyboard.send_key(key_code, pressed=False)
+        self.keyboard.send_key(button.uinput_code, pressed=False)
 
     def _handle_special_key(self, key: str):
         """Handle special keys that trigger application actions instead of uinput."""
-        if key == "SPECIAL_CLOSE":
-            self.app.quit()
-        elif key == "SPECIAL_MODE_TOGGLE":
-            # Mode toggle button goes back to slim
-            self.app.switch_to_layout(self.app.MODE_SLIM)
-        elif key == "SPECIAL_MODE_KEYBOARD":
-            self.app.switch_to_layout(self.app.MODE_KEYBOARD)
-        elif key == "SPECIAL_MODE_FULL":
-            self.app.switch_to_full()
-        elif key == "SPECIAL_MODE_SMALL":
-            self.app.switch_to_small()
-        elif key == "SPECIAL_SETTINGS":
-            self.app.open_settings()
+        handler = self._special_dispatch.get(key)
+        if handler:
+            handler()
 
     def cleanup(self):
         """Cleanup resources (no-op since uinput keyboard manages its own thread)."""
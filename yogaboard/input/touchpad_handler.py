@@ -11,14 +11,14 @@ from yogaboard.input_device.uinput_touchpad import UInputTouchpad
 from yogaboard.ui.touchpad_widget import TouchpadWidget
 
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
 
 if TYPE_CHECKING:
-    from yogaboard.main import KeyboardApp
+    from yogaboard.app import KeyboardApp
     from yogaboard.settings import SettingsManager
 
 
-@dataclass
+@dataclass(slots=True)
 class TouchState:
     """State for tracking a single touch point."""
 
@@ -27,7 +27,6 @@ class TouchState:
     start_y: float
     last_x: float
     last_y: float
-    start_time: float
     has_moved: bool = False  # True if movement exceeded TAP_MAX_MOVEMENT
 
 
@@ -55,6 +54,12 @@ class TouchpadHandler:
         settings_manager: SettingsManager | None = None,
     ):
         self.touchpad = uinput_touchpad
+        # Cache the emitter bound methods once; per-event call sites then
+        # skip the two-step attribute lookup through self.touchpad
+        self._move_pointer = uinput_touchpad.move_pointer
+        self._scroll = uinput_touchpad.scroll
+        self._click = uinput_touchpad.click
+        self._tap = uinput_touchpad.tap
         self.app: KeyboardApp = app
         self.settings_manager = settings_manager
 
@@ -67,11 +72,21 @@ class TouchpadHandler:
             self.scroll_sensitivity = self.DEFAULT_SCROLL_SENSITIVITY
             self.tap_max_duration = self.DEFAULT_TAP_MAX_DURATION
             self.tap_max_movement = self.DEFAULT_TAP_MAX_MOVEMENT
+            self.tap_max_movement_sq = self.tap_max_movement**2
             self.tap_drag_enabled = self.DEFAULT_TAP_DRAG_ENABLED
             self.tap_drag_window = self.DEFAULT_TAP_DRAG_WINDOW
+            # Pre-negated for natural scrolling, so the hot path multiplies
+            # without a separate sign flip
+            self.scroll_sensitivity_neg = -self.scroll_sensitivity
 
         # Touch tracking state
         self.active_touches: dict[object, TouchState] = {}  # sequence -> state
+        # Finger count mirrored as a plain int so hot paths read an
+        # attribute instead of calling len() on the dict
+        self._finger_count = 0
+        # Free list of TouchState objects reused across gestures, so each
+        # finger-down doesn't allocate (only a handful are ever live)
+        self._state_pool: list[TouchState] = []
         self._max_fingers_in_gesture = 0  # For tap type detection
         self._any_finger_moved = False  # For tap detection
         self.first_touch_time = 0.0
@@ -88,6 +103,24 @@ class TouchpadHandler:
         self.scroll_accumulator_x = 0.0
         self.scroll_accumulator_y = 0.0
 
+        # Motion coalesced across one main-loop iteration: multiple touch
+        # updates delivered in the same iteration collapse into a single
+        # uinput move/scroll frame flushed from an idle callback
+        self._pending_move_dx = 0
+        self._pending_move_dy = 0
+        self._pending_scroll_dx = 0
+        self._pending_scroll_dy = 0
+        self._flush_scheduled = False
+
+        # Event-type dispatch table - one dict lookup per event instead of
+        # comparing against up to four Gdk.EventType enum members
+        self._event_dispatch = {
+            Gdk.EventType.TOUCH_BEGIN: self._on_touch_begin,
+            Gdk.EventType.TOUCH_UPDATE: self._on_touch_update,
+            Gdk.EventType.TOUCH_END: self._on_touch_end,
+            Gdk.EventType.TOUCH_CANCEL: self._on_touch_cancel,
+        }
+
     def _apply_settings(self, settings_manager: SettingsManager):
         """Apply settings from the settings manager."""
         touchpad = settings_manager.touchpad
@@ -98,6 +131,10 @@ class TouchpadHandler:
         # These remain at defaults (not exposed in settings UI)
         self.tap_max_duration = self.DEFAULT_TAP_MAX_DURATION
         self.tap_max_movement = self.DEFAULT_TAP_MAX_MOVEMENT
+        self.tap_max_movement_sq = self.tap_max_movement**2
+        # Pre-negated for natural scrolling, so the hot path multiplies
+        # without a separate sign flip
+        self.scroll_sensitivity_neg = -self.scroll_sensitivity
 
     def _on_settings_changed(self, settings_manager: SettingsManager):
         """Callback when settings are updated."""
@@ -112,15 +149,22 @@ class TouchpadHandler:
         """
         touchpad_area = widget.touchpad_area
 
-        # Use EventControllerLegacy for raw touch event access
+        # Use EventControllerLegacy for raw touch event access. Capture
+        # phase routes events straight to the controller without the
+        # bubble-phase walk, and limiting propagation to the native
+        # surface stops further traversal once handled.
         self.legacy_controller = Gtk.EventControllerLegacy.new()
+        self.legacy_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        self.legacy_controller.set_propagation_limit(Gtk.PropagationLimit.SAME_NATIVE)
         self.legacy_controller.connect("event", self._on_event)
         touchpad_area.add_controller(self.legacy_controller)
 
         # Connect mouse buttons with press/release for drag support
-        self._setup_mouse_button(widget.left_click_button, "left")
-        self._setup_mouse_button(widget.middle_click_button, "middle")
-        self._setup_mouse_button(widget.right_click_button, "right")
+        # (absent when the widget was built with show_buttons=False)
+        if widget.left_click_button is not None:
+            self._setup_mouse_button(widget.left_click_button, "left")
+            self._setup_mouse_button(widget.middle_click_button, "middle")
+            self._setup_mouse_button(widget.right_click_button, "right")
 
         # Connect control buttons (if present)
         if widget.mode_button:
@@ -134,31 +178,30 @@ class TouchpadHandler:
         event = controller.get_current_event()
         if event is None:
             return False
-        event_type = event.get_event_type()
-
-        if event_type == Gdk.EventType.TOUCH_BEGIN:
-            self._on_touch_begin(event)
-            return True
-        elif event_type == Gdk.EventType.TOUCH_UPDATE:
-            self._on_touch_update(event)
-            return True
-        elif event_type == Gdk.EventType.TOUCH_END:
-            self._on_touch_end(event)
-            return True
-        elif event_type == Gdk.EventType.TOUCH_CANCEL:
-            self._on_touch_cancel(event)
-            return True
-
-        return False  # Event not handled, let it propagate
+
+        handler = self._event_dispatch.get(event.get_event_type())
+        if handler is None:
+            return False  # Event not handled, let it propagate
+        handler(event)
+        return True
 
     def _on_touch_begin(self, event):
         """Handle finger down event."""
+        # Key on the sequence wrapper itself: PyGObject hands out a fresh
+        # boxed wrapper per get_event_sequence() call, but boxed types hash
+        # and compare by the underlying C pointer, so later wrappers for
+        # the same touch still find this entry (id() would not)
         sequence = event.get_event_sequence()
         success, x, y = event.get_position()
-        now = time.monotonic()
+        if not success:
+            return
 
-        # If this is the first finger, reset gesture state
-        if len(self.active_touches) == 0:
+        # If this is the first finger, reset gesture state. The clock is
+        # only read here - later fingers reuse first_touch_time, which is
+        # all tap detection looks at.
+        prev_count = self._finger_count
+        if prev_count == 0:
+            now = time.monotonic()
             self.first_touch_time = now
             self._max_fingers_in_gesture = 0
             self._any_finger_moved = False
@@ -170,33 +213,45 @@ class TouchpadHandler:
             # Check for tap-drag: single finger touch shortly after a tap
             if self.tap_drag_enabled and (now - self._last_tap_time) < self.tap_drag_window:
                 self._tap_drag_active = True
-                self.touchpad.click("left", pressed=True)
-
-        # Store touch state
-        self.active_touches[sequence] = TouchState(
-            sequence=sequence,
-            start_x=x,
-            start_y=y,
-            last_x=x,
-            last_y=y,
-            start_time=now,
-            has_moved=False,
-        )
-
-        # Track maximum fingers for tap detection
-        current_count = len(self.active_touches)
-        self._max_fingers_in_gesture = max(
-            self._max_fingers_in_gesture, current_count
-        )
+                self._click("left", pressed=True)
+
+        # Store touch state, reusing a pooled object when available
+        if self._state_pool:
+            touch = self._state_pool.pop()
+            touch.sequence = sequence
+            touch.start_x = x
+            touch.start_y = y
+            touch.last_x = x
+            touch.last_y = y
+            touch.has_moved = False
+        else:
+            touch = TouchState(
+                sequence=sequence,
+                start_x=x,
+                start_y=y,
+                last_x=x,
+                last_y=y,
+                has_moved=False,
+            )
+        self.active_touches[sequence] = touch
+        self._finger_count = prev_count + 1
+
+        # Track maximum fingers for tap detection. A branch instead of
+        # max(): the count can dip below the recorded peak when a finger
+        # lifts mid-gesture, so plain assignment would be wrong.
+        current_count = prev_count + 1
+        if current_count > self._max_fingers_in_gesture:
+            self._max_fingers_in_gesture = current_count
 
     def _on_touch_update(self, event):
         """Handle finger move event."""
-        sequence = event.get_event_sequence()
-        if sequence not in self.active_touches:
+        touch = self.active_touches.get(event.get_event_sequence())
+        if touch is None:
             return
 
-        touch = self.active_touches[sequence]
         success, x, y = event.get_position()
+        if not success:
+            return
 
         # Calculate delta from last position
         dx = x - touch.last_x
@@ -206,14 +261,17 @@ class TouchpadHandler:
         touch.last_x = x
         touch.last_y = y
 
-        # Check if this movement exceeds tap threshold
-        total_movement = abs(x - touch.start_x) + abs(y - touch.start_y)
-        if total_movement > self.tap_max_movement:
-            touch.has_moved = True
-            self._any_finger_moved = True
+        # Check if this movement exceeds tap threshold - only until the
+        # flag latches, so long drags skip the distance math entirely
+        if not touch.has_moved:
+            ddx = x - touch.start_x
+            ddy = y - touch.start_y
+            if ddx * ddx + ddy * ddy > self.tap_max_movement_sq:
+                touch.has_moved = True
+                self._any_finger_moved = True
 
         # Process based on finger count
-        finger_count = len(self.active_touches)
+        finger_count = self._finger_count
 
         if finger_count == 1:
             # Single finger: pointer movement
@@ -224,42 +282,49 @@ class TouchpadHandler:
 
     def _on_touch_end(self, event):
         """Handle finger up event."""
-        sequence = event.get_event_sequence()
-        if sequence not in self.active_touches:
+        # Remove this touch and return its state to the pool (single lookup)
+        touch = self.active_touches.pop(event.get_event_sequence(), None)
+        if touch is None:
             return
-
-        # Remove this touch
-        del self.active_touches[sequence]
+        self._state_pool.append(touch)
+        self._finger_count -= 1
 
         # If all fingers are now up
-        if len(self.active_touches) == 0:
+        if self._finger_count == 0:
             # End tap-drag if active
             if self._tap_drag_active:
-                self.touchpad.click("left", pressed=False)
+                self._click("left", pressed=False)
                 self._tap_drag_active = False
             else:
                 # Check for tap gestures
                 tap_result = self._detect_tap_gesture()
                 if tap_result:
-                    self.touchpad.tap(tap_result)
+                    self._tap(tap_result)
 
     def _on_touch_cancel(self, event):
         """Handle cancelled touch - cleanup without triggering gestures."""
-        sequence = event.get_event_sequence()
-        if sequence in self.active_touches:
-            del self.active_touches[sequence]
+        touch = self.active_touches.pop(event.get_event_sequence(), None)
+        if touch is not None:
+            self._state_pool.append(touch)
+            self._finger_count -= 1
 
         # If all touches cancelled, reset state
-        if len(self.active_touches) == 0:
+        if self._finger_count == 0:
             # Release tap-drag if active
             if self._tap_drag_active:
-                self.touchpad.click("left", pressed=False)
+                self._click("left", pressed=False)
                 self._tap_drag_active = False
             self._reset_gesture_state()
 
     def _reset_gesture_state(self):
         """Reset all gesture tracking state."""
+        self._state_pool.extend(self.active_touches.values())
         self.active_touches.clear()
+        self._finger_count = 0
+        self._pending_move_dx = 0
+        self._pending_move_dy = 0
+        self._pending_scroll_dx = 0
+        self._pending_scroll_dy = 0
         self.scroll_accumulator_x = 0.0
         self.scroll_accumulator_y = 0.0
         self.pointer_accumulator_x = 0.0
@@ -269,30 +334,72 @@ class TouchpadHandler:
 
     def _process_single_finger_motion(self, dx: float, dy: float):
         """Convert finger motion to pointer movement with sub-pixel precision."""
-        self.pointer_accumulator_x += dx * self.pointer_sensitivity
-        self.pointer_accumulator_y += dy * self.pointer_sensitivity
+        # Straight-line local arithmetic - this runs on every touch update,
+        # so accumulate into locals and store the residual back once
+        ax = self.pointer_accumulator_x + dx * self.pointer_sensitivity
+        ay = self.pointer_accumulator_y + dy * self.pointer_sensitivity
+
+        # Common case for gentle motion: both accumulators still sub-pixel,
+        # so skip the truncation and flush arithmetic entirely
+        if -1.0 < ax < 1.0 and -1.0 < ay < 1.0:
+            self.pointer_accumulator_x = ax
+            self.pointer_accumulator_y = ay
+            return
 
-        pointer_dx = int(self.pointer_accumulator_x)
-        pointer_dy = int(self.pointer_accumulator_y)
+        pointer_dx = int(ax)
+        pointer_dy = int(ay)
 
         if pointer_dx != 0 or pointer_dy != 0:
-            self.touchpad.move_pointer(pointer_dx, pointer_dy)
-            self.pointer_accumulator_x -= pointer_dx
-            self.pointer_accumulator_y -= pointer_dy
+            self._pending_move_dx += pointer_dx
+            self._pending_move_dy += pointer_dy
+            self._schedule_motion_flush()
+
+        self.pointer_accumulator_x = ax - pointer_dx
+        self.pointer_accumulator_y = ay - pointer_dy
 
     def _process_two_finger_motion(self, dx: float, dy: float):
         """Convert two-finger motion to scroll events (natural scrolling)."""
         # Natural scrolling: finger up = content up = positive wheel
-        self.scroll_accumulator_x += dx * self.scroll_sensitivity
-        self.scroll_accumulator_y -= dy * self.scroll_sensitivity  # Inverted
+        # (the y sensitivity is pre-negated to fold in the inversion)
+        ax = self.scroll_accumulator_x + dx * self.scroll_sensitivity
+        ay = self.scroll_accumulator_y + dy * self.scroll_sensitivity_neg
 
-        scroll_x = int(self.scroll_accumulator_x)
-        scroll_y = int(self.scroll_accumulator_y)
+        scroll_x = int(ax)
+        scroll_y = int(ay)
 
         if scroll_x != 0 or scroll_y != 0:
-            self.touchpad.scroll(scroll_x, scroll_y)
-            self.scroll_accumulator_x -= scroll_x
-            self.scroll_accumulator_y -= scroll_y
+            self._pending_scroll_dx += scroll_x
+            self._pending_scroll_dy += scroll_y
+            self._schedule_motion_flush()
+
+        self.scroll_accumulator_x = ax - scroll_x
+        self.scroll_accumulator_y = ay - scroll_y
+
+    def _schedule_motion_flush(self):
+        """Arrange for pending motion to flush once this loop iteration."""
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            GLib.idle_add(self._flush_motion, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def _flush_motion(self):
+        """Emit motion coalesced from the current main-loop iteration."""
+        self._flush_scheduled = False
+
+        dx = self._pending_move_dx
+        dy = self._pending_move_dy
+        if dx != 0 or dy != 0:
+            self._pending_move_dx = 0
+            self._pending_move_dy = 0
+            self._move_pointer(dx, dy)
+
+        sx = self._pending_scroll_dx
+        sy = self._pending_scroll_dy
+        if sx != 0 or sy != 0:
+            self._pending_scroll_dx = 0
+            self._pending_scroll_dy = 0
+            self._scroll(sx, sy)
+
+        return GLib.SOURCE_REMOVE
 
     def _detect_tap_gesture(self) -> str | None:
         """
@@ -317,8 +424,9 @@ class TouchpadHandler:
 
         # Determine tap type based on max finger count during gesture
         if self._max_fingers_in_gesture == 1:
-            # Record tap time for potential tap-drag
-            self._last_tap_time = time.monotonic()
+            # Record tap time for potential tap-drag (reuse the timestamp
+            # taken at the top rather than reading the clock again)
+            self._last_tap_time = now
             return "left"
         elif self._max_fingers_in_gesture == 2:
             return "right"
@@ -334,13 +442,13 @@ class TouchpadHandler:
         gesture.set_touch_only(True)
 
         def on_pressed(g, n_press, x, y):
-            self.touchpad.click(button_name, pressed=True)
+            self._click(button_name, pressed=True)
 
         def on_released(g, n_press, x, y):
-            self.touchpad.click(button_name, pressed=False)
+            self._click(button_name, pressed=False)
 
         def on_cancel(g, sequence):
-            self.touchpad.click(button_name, pressed=False)
+            self._click(button_name, pressed=False)
 
         gesture.connect("pressed", on_pressed)
         gesture.connect("released", on_released)
@@ -353,11 +461,11 @@ class TouchpadHandler:
 
     def _on_close_clicked(self, button):
         """Handle close button click."""
-        self.app.quit()
+        self.app.hide_window()
 
     def cleanup(self):
         """Cleanup resources."""
         if self._tap_drag_active:
-            self.touchpad.click("left", pressed=False)
+            self._click("left", pressed=False)
             self._tap_drag_active = False
         self._reset_gesture_state()
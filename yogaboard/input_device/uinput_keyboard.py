@@ -1,27 +1,20 @@
 """Virtual keyboard device using Linux uinput subsystem."""
 
 import uinput
-import time
-import threading
-from collections import deque
-from dataclasses import dataclass
-from typing import Literal
-
-
-@dataclass
-class KeyEvent:
-    """Represents a key press or release event."""
-
-    key_code: tuple[int, int]
-    action: Literal["press", "release"]
 
 
 class UInputKeyboard:
-    """Virtual keyboard using Linux uinput subsystem with threaded event processing."""
+    """
+    Virtual keyboard using Linux uinput subsystem.
+
+    Events are written directly from the caller - everything originates on
+    the GTK main thread and emit() is a single write() syscall, so a worker
+    thread and queue would only add latency.
+    """
 
     # Map of all keyboard keys we want to support (standard 105-key keyboard)
     # Using uinput key codes (KEY_*)
-    SUPPORTED_KEYS = [
+    SUPPORTED_KEYS = (
         # Letters (A-Z)
         uinput.KEY_A,
         uinput.KEY_B,
@@ -179,8 +172,6 @@ class UInputKeyboard:
         uinput.KEY_CALC,  # Calculator
         uinput.KEY_FILE,  # File manager
         uinput.KEY_COMPUTER,
-        # Screen capture
-        uinput.KEY_PRINT,  # Print screen / screenshot
         # Additional F-keys (F13-F24 for extended keyboards)
         uinput.KEY_F13,
         uinput.KEY_F14,
@@ -206,96 +197,49 @@ class UInputKeyboard:
         uinput.KEY_PROG2,  # Programmable key 2
         uinput.KEY_PROG3,  # Programmable key 3
         uinput.KEY_PROG4,  # Programmable key 4
-    ]
+    )
 
     def __init__(self):
-        """Initialize virtual keyboard device with threaded event processing."""
-        self.event_queue = deque()
-        self.queue_lock = threading.Lock()
-        self.running = True
-        self.device = None
-
-        # Start the uinput thread
-        self.thread = threading.Thread(
-            target=self._event_loop, daemon=True, name="uinput-worker"
+        """Initialize virtual keyboard device."""
+        # Created synchronously so a permissions failure raises here, on
+        # the caller's thread, where the app can report it
+        self.device = uinput.Device(
+            self.SUPPORTED_KEYS,
+            name="Yogaboard-Virtual-Keyboard",
         )
-        self.thread.start()
-
-    def _event_loop(self):
-        """Main event loop running in separate thread."""
-        try:
-            # Create uinput device with keyboard capabilities
-            self.device = uinput.Device(
-                self.SUPPORTED_KEYS,
-                name="Yogaboard-Virtual-Keyboard",
-            )
 
-            # Small delay for device registration
-            time.sleep(0.1)
-
-        except Exception as e:
-            print(f"Failed to create uinput device: {e}")
-            print("Make sure you have permissions to access /dev/uinput")
-            print("Run: sudo usermod -a -G input $USER")
-            self.running = False
-            return
-
-        # Process events from queue
-        while self.running:
-            event = None
-
-            # Get next event from queue
-            with self.queue_lock:
-                if self.event_queue:
-                    event = self.event_queue.popleft()
-
-            if event:
-                try:
-                    self._send_key_event(event)
-                except Exception as e:
-                    print(f"Error sending key event: {e}")
-            else:
-                # Sleep briefly if queue is empty to avoid busy-waiting
-                time.sleep(0.001)
+    def send_key(self, key_code: tuple[int, int], pressed=True):
+        """
+        Send a key press or release event.
 
-        # Cleanup device when loop exits
+        Args:
+            key_code: uinput key code (e.g., uinput.KEY_A)
+            pressed: True for press, False for release
+        """
         if self.device:
-            self.device.destroy()
+            self.device.emit(key_code, 1 if pressed else 0)
 
-    def _send_key_event(self, event: KeyEvent):
+    def send_keys(self, events: list[tuple[tuple[int, int], bool]]):
         """
-        Send a key event to uinput device.
+        Send several key events as a single input frame.
+
+        All events are emitted without intermediate sync reports, then one
+        SYN_REPORT closes the frame - this is what consumers expect for
+        combos like a modifier plus a letter.
 
         Args:
-            event: KeyEvent containing key_code and action
+            events: List of (key_code, pressed) pairs
         """
         if not self.device:
             return
 
-        if event.action == "press":
-            self.device.emit(event.key_code, 1)
-        else:  # release
-            self.device.emit(event.key_code, 0)
+        for key_code, pressed in events:
+            self.device.emit(key_code, 1 if pressed else 0, syn=False)
 
-        # Sync event to ensure proper event ordering
         self.device.syn()
 
-    def send_key(self, key_code: tuple[int, int], pressed=True):
-        """
-        Queue a key press or release event.
-
-        Args:
-            key_code: uinput key code (e.g., uinput.KEY_A)
-            pressed: True for press, False for release
-        """
-        action = "press" if pressed else "release"
-        event = KeyEvent(key_code=key_code, action=action)
-
-        with self.queue_lock:
-            self.event_queue.append(event)
-
     def cleanup(self):
-        """Cleanup and stop the event processing thread."""
-        self.running = False
-        if self.thread.is_alive():
-            self.thread.join(timeout=1.0)
+        """Destroy the virtual device."""
+        if self.device:
+            self.device.destroy()
+            self.device = None
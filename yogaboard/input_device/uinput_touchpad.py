@@ -5,14 +5,19 @@ import time
 import threading
 from collections import deque
 from dataclasses import dataclass
-from typing import Literal
 
+# Event type tags - small ints so the worker dispatches with an indexed
+# lookup instead of comparing strings down an elif chain
+MOVE = 0
+SCROLL = 1
+CLICK = 2
 
-@dataclass
+
+@dataclass(slots=True)
 class TouchpadEvent:
     """Represents a touchpad event."""
 
-    event_type: Literal["move", "scroll", "click"]
+    event_type: int  # MOVE, SCROLL or CLICK
     # For move/scroll: dx, dy values
     # For click: button name and pressed state
     dx: int = 0
@@ -24,7 +29,7 @@ class TouchpadEvent:
 class UInputTouchpad:
     """Virtual touchpad using Linux uinput subsystem with threaded event processing."""
 
-    SUPPORTED_EVENTS = [
+    SUPPORTED_EVENTS = (
         uinput.REL_X,  # Pointer X motion
         uinput.REL_Y,  # Pointer Y motion
         uinput.REL_WHEEL,  # Vertical scroll
@@ -32,7 +37,7 @@ class UInputTouchpad:
         uinput.BTN_LEFT,  # Left click
         uinput.BTN_RIGHT,  # Right click
         uinput.BTN_MIDDLE,  # Middle click
-    ]
+    )
 
     BUTTON_MAP = {
         "left": uinput.BTN_LEFT,
@@ -42,10 +47,18 @@ class UInputTouchpad:
 
     def __init__(self):
         """Initialize virtual touchpad device with threaded event processing."""
+        # deque append/popleft are atomic under the GIL, so producers don't
+        # need a lock - they append and set the wake event
         self.event_queue = deque()
-        self.queue_lock = threading.Lock()
+        self.wake_event = threading.Event()
         self.running = True
         self.device = None
+        # Free list of sent TouchpadEvents; reusing them avoids allocating
+        # a fresh dataclass per motion event during drags. list.append/pop
+        # are atomic, so producers and the worker can share it unlocked.
+        self._event_pool: list[TouchpadEvent] = []
+        # Indexed by the MOVE/SCROLL/CLICK event tags
+        self._handlers = (self._send_move, self._send_scroll, self._send_click)
 
         # Start the uinput thread
         self.thread = threading.Thread(
@@ -72,23 +85,33 @@ class UInputTouchpad:
             self.running = False
             return
 
-        # Process events from queue
+        # Process events from queue, blocking until a producer signals
+        error_reported = False
         while self.running:
-            event = None
-
-            # Get next event from queue
-            with self.queue_lock:
-                if self.event_queue:
-                    event = self.event_queue.popleft()
-
-            if event:
+            try:
+                batch = [self.event_queue.popleft()]
+            except IndexError:
+                # Timeout so a missed wakeup can't hang shutdown
+                self.wake_event.wait(timeout=0.1)
+                self.wake_event.clear()
+                continue
+
+            # Drain the rest of a burst in the same wake, bounded so the
+            # loop stays responsive to running=False
+            while self.event_queue and len(batch) < 32:
+                batch.append(self.event_queue.popleft())
+
+            for event in batch:
                 try:
                     self._send_event(event)
                 except Exception as e:
-                    print(f"Error sending touchpad event: {e}")
-            else:
-                # Sleep briefly if queue is empty to avoid busy-waiting
-                time.sleep(0.001)
+                    # Report once - a wedged device would otherwise print
+                    # (format + stdout lock + write) at full event rate
+                    if not error_reported:
+                        print(f"Error sending touchpad event: {e}")
+                        error_reported = True
+                if len(self._event_pool) < 64:
+                    self._event_pool.append(event)
 
         # Cleanup device when loop exits
         if self.device:
@@ -99,24 +122,45 @@ class UInputTouchpad:
         if not self.device:
             return
 
-        if event.event_type == "move":
-            if event.dx != 0:
-                self.device.emit(uinput.REL_X, event.dx)
-            if event.dy != 0:
-                self.device.emit(uinput.REL_Y, event.dy)
-        elif event.event_type == "scroll":
-            # Natural scrolling: finger up = content up (positive wheel value)
-            if event.dy != 0:
-                self.device.emit(uinput.REL_WHEEL, event.dy)
-            if event.dx != 0:
-                self.device.emit(uinput.REL_HWHEEL, event.dx)
-        elif event.event_type == "click":
-            button_code = self.BUTTON_MAP.get(event.button)
-            if button_code:
-                self.device.emit(button_code, 1 if event.pressed else 0)
-
+        self._handlers[event.event_type](event)
         self.device.syn()
 
+    # Sub-events are emitted with syn=False (emit() syncs by default)
+    # so diagonal motion or scroll shares the single closing SYN_REPORT
+
+    def _send_move(self, event: TouchpadEvent):
+        if event.dx != 0:
+            self.device.emit(uinput.REL_X, event.dx, syn=False)
+        if event.dy != 0:
+            self.device.emit(uinput.REL_Y, event.dy, syn=False)
+
+    def _send_scroll(self, event: TouchpadEvent):
+        # Natural scrolling: finger up = content up (positive wheel value)
+        if event.dy != 0:
+            self.device.emit(uinput.REL_WHEEL, event.dy, syn=False)
+        if event.dx != 0:
+            self.device.emit(uinput.REL_HWHEEL, event.dx, syn=False)
+
+    def _send_click(self, event: TouchpadEvent):
+        button_code = self.BUTTON_MAP.get(event.button)
+        if button_code:
+            self.device.emit(button_code, 1 if event.pressed else 0, syn=False)
+
+    def _take_event(
+        self, event_type: int, dx: int = 0, dy: int = 0, button: str = "", pressed: bool = False
+    ) -> TouchpadEvent:
+        """Reuse a pooled event if one is available, else allocate."""
+        try:
+            event = self._event_pool.pop()
+        except IndexError:
+            return TouchpadEvent(event_type, dx, dy, button, pressed)
+        event.event_type = event_type
+        event.dx = dx
+        event.dy = dy
+        event.button = button
+        event.pressed = pressed
+        return event
+
     def move_pointer(self, dx: int, dy: int):
         """
         Queue pointer motion event.
@@ -127,9 +171,9 @@ class UInputTouchpad:
         """
         if dx == 0 and dy == 0:
             return
-        event = TouchpadEvent(event_type="move", dx=dx, dy=dy)
-        with self.queue_lock:
-            self.event_queue.append(event)
+        event = self._take_event(MOVE, dx=dx, dy=dy)
+        self.event_queue.append(event)
+        self.wake_event.set()
 
     def scroll(self, dx: int, dy: int):
         """
@@ -141,9 +185,9 @@ class UInputTouchpad:
         """
         if dx == 0 and dy == 0:
             return
-        event = TouchpadEvent(event_type="scroll", dx=dx, dy=dy)
-        with self.queue_lock:
-            self.event_queue.append(event)
+        event = self._take_event(SCROLL, dx=dx, dy=dy)
+        self.event_queue.append(event)
+        self.wake_event.set()
 
     def click(self, button: str, pressed: bool):
         """
@@ -153,9 +197,9 @@ class UInputTouchpad:
             button: "left", "right", or "middle"
             pressed: True for press, False for release
         """
-        event = TouchpadEvent(event_type="click", button=button, pressed=pressed)
-        with self.queue_lock:
-            self.event_queue.append(event)
+        event = self._take_event(CLICK, button=button, pressed=pressed)
+        self.event_queue.append(event)
+        self.wake_event.set()
 
     def tap(self, button: str):
         """
@@ -170,5 +214,7 @@ class UInputTouchpad:
     def cleanup(self):
         """Cleanup and stop the event processing thread."""
         self.running = False
+        # Wake the worker so it notices running=False immediately
+        self.wake_event.set()
         if self.thread.is_alive():
             self.thread.join(timeout=1.0)
@@ -1,23 +1,32 @@
 """Layout parser for JSON keyboard layout files."""
 
 import json
+import os
+import sys
+from functools import lru_cache
+
 import uinput
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitKey:
     """Represents one half of a split key."""
 
     label: str
     key: str  # uinput key name (e.g., "KEY_UP")
+    # Resolved lazily on first use so SPECIAL_* keys never hit getattr
+    _uinput_code: Optional[tuple[int, int]] = field(default=None, repr=False)
 
     def get_uinput_key(self) -> tuple[int, int]:
-        return getattr(uinput, self.key)
+        code = self._uinput_code
+        if code is None:
+            code = self._uinput_code = getattr(uinput, self.key)
+        return code
 
 
-@dataclass
+@dataclass(slots=True)
 class Key:
     """Represents a single key on the keyboard."""
 
@@ -30,16 +39,27 @@ class Key:
     # Split key support: if both are set, key is rendered as top/bottom split
     top_key: Optional[SplitKey] = None
     bottom_key: Optional[SplitKey] = None
+    # Resolved lazily on first use so SPECIAL_* keys never hit getattr
+    _uinput_code: Optional[tuple[int, int]] = field(default=None, repr=False)
+    # Pixel width at the standard 60px-per-unit scale, computed once here
+    # so widget construction reads an int instead of multiplying
+    width_px: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.width_px = int(60 * self.width)
 
     def is_split(self) -> bool:
         """Return True if this is a vertically split key."""
         return self.top_key is not None and self.bottom_key is not None
 
     def get_uinput_key(self) -> tuple[int, int]:
-        return getattr(uinput, self.key)
+        code = self._uinput_code
+        if code is None:
+            code = self._uinput_code = getattr(uinput, self.key)
+        return code
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     """Represents a row of keys."""
 
@@ -47,7 +67,7 @@ class Row:
     height: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Layout:
     """Represents a complete keyboard layout."""
 
@@ -59,17 +79,40 @@ class Layout:
 class LayoutParser:
     """Parser for JSON keyboard layout files."""
 
+    @staticmethod
+    def _resolve(key_name: str) -> Optional[tuple[int, int]]:
+        """Resolve a uinput key name eagerly; SPECIAL_* keys have no code.
+
+        Split-key parents carry an empty key name (only their top/bottom
+        halves are real keys), so those resolve to None as well.
+        """
+        if not key_name or key_name.startswith("SPECIAL_"):
+            return None
+        return getattr(uinput, key_name)
+
     @staticmethod
     def load(filepath: str) -> Layout:
         """
         Load a keyboard layout from a JSON file.
 
+        Repeat loads of an unchanged file return the cached Layout - the
+        cache key includes the file's mtime, so editing a layout on disk
+        still takes effect on the next load.
+
         Args:
             filepath: Path to the JSON layout file
 
         Returns:
             Layout object containing all keyboard configuration
         """
+        return LayoutParser._load(
+            os.path.abspath(filepath), os.stat(filepath).st_mtime_ns
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load(filepath: str, mtime_ns: int) -> Layout:
+        """Parse the layout file; memoized on (path, mtime)."""
         with open(filepath, "r") as f:
             data = json.load(f)
 
@@ -78,13 +121,34 @@ class LayoutParser:
             keys = []
             for key_data in row_data["keys"]:
                 # Parse nested SplitKey objects if present
-                if "top_key" in key_data and key_data["top_key"] is not None:
-                    key_data["top_key"] = SplitKey(**key_data["top_key"])
-                if "bottom_key" in key_data and key_data["bottom_key"] is not None:
-                    key_data["bottom_key"] = SplitKey(**key_data["bottom_key"])
-                keys.append(Key(**key_data))
-            del row_data["keys"]
-            rows.append(Row(keys=keys, **row_data))
+                top_key = key_data.get("top_key")
+                if top_key is not None:
+                    top_key = SplitKey(
+                        label=sys.intern(top_key["label"]),
+                        key=top_key["key"],
+                        _uinput_code=LayoutParser._resolve(top_key["key"]),
+                    )
+                bottom_key = key_data.get("bottom_key")
+                if bottom_key is not None:
+                    bottom_key = SplitKey(
+                        label=sys.intern(bottom_key["label"]),
+                        key=bottom_key["key"],
+                        _uinput_code=LayoutParser._resolve(bottom_key["key"]),
+                    )
+                keys.append(
+                    Key(
+                        label=sys.intern(key_data["label"]),
+                        key=key_data["key"],
+                        width=key_data.get("width", 1.0),
+                        classes=key_data.get("classes", []),
+                        modifier=key_data.get("modifier"),
+                        secondary_label=key_data.get("secondary_label"),
+                        top_key=top_key,
+                        bottom_key=bottom_key,
+                        _uinput_code=LayoutParser._resolve(key_data["key"]),
+                    )
+                )
+            rows.append(Row(keys=keys, height=row_data.get("height", 100)))
 
         return Layout(
             name=data["name"], rows=rows, window_height=data.get("window_height")
@@ -1,268 +1,13 @@
 """Main application entry point for yogaboard virtual keyboard."""
 
-from ctypes import CDLL
-
-# Must load layer-shell before importing GTK
-CDLL("libgtk4-layer-shell.so.0")
-
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Gtk4LayerShell", "1.0")
-from gi.repository import Gtk, Gio
-
-from yogaboard.ui.window import KeyboardWindow
-from yogaboard.ui.keyboard_widget import KeyboardWidget
-from yogaboard.ui.touchpad_widget import TouchpadWidget
-from yogaboard.layout.parser import LayoutParser
-from yogaboard.input_device.uinput_keyboard import UInputKeyboard
-from yogaboard.input_device.uinput_touchpad import UInputTouchpad
-from yogaboard.input.touch_handler import TouchHandler
-from yogaboard.input.touchpad_handler import TouchpadHandler
-from yogaboard.input.modifier_state import ModifierState
-from yogaboard.settings import SettingsManager
-import os
-
-
-class KeyboardApp(Gtk.Application):
-    """Main GTK application for yogaboard virtual keyboard."""
-
-    MODE_KEYBOARD = "keyboard"
-    MODE_SLIM = "slim"
-    MODE_FULL = "full"  # Keyboard + touchpad below (full height)
-    MODE_SMALL = "small"  # Keyboard + touchpad to the right
-
-    def __init__(self):
-        super().__init__(application_id="org.aeracode.yogaboard")
-        self.current_mode = self.MODE_SLIM
-        self.keyboard_widget = None
-        self.touchpad_widget = None
-        self.settings_manager = SettingsManager()
-        self.settings_dialog = None
-        self.base_css_provider = None
-        self.theme_css_provider = None
-
-    def do_activate(self):
-        """Initialize and show the virtual keyboard."""
-        try:
-            # Load settings
-            self.settings_manager.load()
-
-            # Initialize uinput virtual keyboard
-            self.uinput_keyboard = UInputKeyboard()
-
-            # Load layouts
-            qwerty_layout_path = os.path.join(
-                os.path.dirname(__file__), "../layouts/qwerty.json"
-            )
-            slim_layout_path = os.path.join(
-                os.path.dirname(__file__), "../layouts/slim.json"
-            )
-            compact_layout_path = os.path.join(
-                os.path.dirname(__file__), "../layouts/qwerty-compact.json"
-            )
-            qwerty_layout = LayoutParser.load(qwerty_layout_path)
-            slim_layout = LayoutParser.load(slim_layout_path)
-            compact_layout = LayoutParser.load(compact_layout_path)
-
-            self.layouts = {
-                self.MODE_KEYBOARD: qwerty_layout,
-                self.MODE_SLIM: slim_layout,
-                self.MODE_SMALL: compact_layout,
-            }
-
-            # Create main window
-            self.window = KeyboardWindow(self)
-
-            # Setup touch handling with app reference
-            self.touch_handler = TouchHandler(self.uinput_keyboard, app=self)
-
-            # Initialize uinput virtual touchpad
-            self.uinput_touchpad = UInputTouchpad()
-            self.touchpad_handler = TouchpadHandler(
-                self.uinput_touchpad, app=self, settings_manager=self.settings_manager
-            )
-
-            # Load base CSS styling
-            self.base_css_provider = Gtk.CssProvider()
-            css_path = os.path.join(os.path.dirname(__file__), "../resources/style.css")
-            self.base_css_provider.load_from_path(css_path)
-            Gtk.StyleContext.add_provider_for_display(
-                self.window.get_display(),
-                self.base_css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-
-            # Load theme CSS (on top of base)
-            self.theme_css_provider = Gtk.CssProvider()
-            self._apply_theme(self.settings_manager.appearance.color_scheme)
-
-            # Register for settings changes
-            self.settings_manager.add_change_callback(self._on_settings_changed)
-
-            # Start in slim mode
-            self.switch_to_layout(self.MODE_SLIM)
-
-            self.window.present()
-
-        except Exception as e:
-            print(f"Error starting yogaboard: {e}")
-            import traceback
-
-            traceback.print_exc()
-            self.quit()
-
-    def toggle_mode(self):
-        """Cycle between keyboard, slim, full, and small modes."""
-        if self.current_mode == self.MODE_KEYBOARD:
-            self.switch_to_layout(self.MODE_SLIM)
-        elif self.current_mode == self.MODE_SLIM:
-            self.switch_to_full()
-        elif self.current_mode == self.MODE_FULL:
-            self.switch_to_small()
-        else:
-            self.switch_to_layout(self.MODE_KEYBOARD)
-
-    def switch_to_layout(self, mode):
-        """Switch to a specific layout mode."""
-        self.current_mode = mode
-        layout = self.layouts[mode]
-
-        # Use window height from layout, or fallback to 400px
-        height = layout.window_height if layout.window_height else 400
-
-        # Update window height
-        self.window.set_default_size(-1, height)
-
-        # Clear current widget
-        self.window.set_child(None)
-        self.window.toggle_full(False)
-        self.touchpad_widget = None
-
-        self.keyboard_widget = KeyboardWidget(layout)
-        self.window.set_child(self.keyboard_widget)
-
-        # Re-setup touch handlers
-        self.touch_handler.setup_gestures(self.keyboard_widget)
-
-    def switch_to_full(self):
-        """Switch to full mode: keyboard + touchpad below, full screen height."""
-        self.current_mode = self.MODE_FULL
-
-        # Clear current widget
-        self.window.set_child(None)
-        self.window.toggle_full(True)
-
-        # Create vertical container
-        container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-
-        # Add keyboard widget (QWERTY layout)
-        layout = self.layouts[self.MODE_KEYBOARD]
-        self.keyboard_widget = KeyboardWidget(layout)
-        container.append(self.keyboard_widget)
-
-        # Add touchpad widget below (no controls - keyboard has them)
-        # Constrain to ~1/3 screen width, aligned to the right
-        self.touchpad_widget = TouchpadWidget(show_controls=False)
-        self.touchpad_widget.set_vexpand(True)
-        self.touchpad_widget.set_hexpand(False)
-        self.touchpad_widget.set_halign(Gtk.Align.CENTER)
-        self.touchpad_widget.set_size_request(700, 400)  # ~1/3 of typical screen width
-        container.append(self.touchpad_widget)
-
-        self.window.set_child(container)
-
-        # Full screen height (use a large value, layer shell will constrain it)
-        self.window.set_default_size(-1, 1000)
-
-        # Setup handlers
-        self.touch_handler.setup_gestures(self.keyboard_widget)
-        self.touchpad_handler.setup_gestures(self.touchpad_widget)
-
-    def switch_to_small(self):
-        """Switch to small mode: compact keyboard + touchpad to the right."""
-        self.current_mode = self.MODE_SMALL
-
-        # Clear current widget
-        self.window.set_child(None)
-        self.window.toggle_full(False)
-
-        # Use compact layout
-        layout = self.layouts[self.MODE_SMALL]
-        height = layout.window_height if layout.window_height else 200
-
-        # Create horizontal container
-        container = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-
-        # Add keyboard widget (compact layout)
-        self.keyboard_widget = KeyboardWidget(layout)
-        container.append(self.keyboard_widget)
-
-        # Add touchpad widget to the right (no controls - keyboard has them)
-        self.touchpad_widget = TouchpadWidget(show_controls=False)
-        self.touchpad_widget.set_size_request(300, -1)  # Fixed width for touchpad
-        container.append(self.touchpad_widget)
-
-        self.window.set_child(container)
-        self.window.set_default_size(-1, height)
-
-        # Setup handlers
-        self.touch_handler.setup_gestures(self.keyboard_widget)
-        self.touchpad_handler.setup_gestures(self.touchpad_widget)
-
-    def open_settings(self):
-        """Open the settings dialog."""
-        if self.settings_dialog is None or not self.settings_dialog.is_visible():
-            from yogaboard.ui.settings_dialog import SettingsDialog
-
-            self.settings_dialog = SettingsDialog(self, self.settings_manager)
-            self.settings_dialog.present()
-
-    def _apply_theme(self, theme_id: str):
-        """Apply a color scheme theme."""
-        display = self.window.get_display()
-
-        # Remove existing theme provider if present
-        if self.theme_css_provider is not None:
-            Gtk.StyleContext.remove_provider_for_display(display, self.theme_css_provider)
-
-        # Create new provider and load theme
-        self.theme_css_provider = Gtk.CssProvider()
-
-        if theme_id != "default":
-            theme_path = os.path.join(
-                os.path.dirname(__file__),
-                f"../resources/themes/{theme_id}.css"
-            )
-            if os.path.exists(theme_path):
-                self.theme_css_provider.load_from_path(theme_path)
-
-        # Add at higher priority than base (so it overrides)
-        Gtk.StyleContext.add_provider_for_display(
-            display,
-            self.theme_css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION + 1,
-        )
-
-    def _on_settings_changed(self, settings: SettingsManager):
-        """Handle settings changes including theme updates."""
-        self._apply_theme(settings.appearance.color_scheme)
-
-    def do_shutdown(self):
-        """Cleanup when application is closing."""
-        if hasattr(self, "touch_handler"):
-            self.touch_handler.cleanup()
-        if hasattr(self, "touchpad_handler"):
-            self.touchpad_handler.cleanup()
-        if hasattr(self, "uinput_keyboard"):
-            self.uinput_keyboard.cleanup()
-        if hasattr(self, "uinput_touchpad"):
-            self.uinput_touchpad.cleanup()
-        Gtk.Application.do_shutdown(self)
-
 
 def main():
     """Main entry point for the application."""
+    # Imported here rather than at module top: pulling in KeyboardApp
+    # preloads libgtk4-layer-shell and parses the GTK introspection data,
+    # which importing this module shouldn't pay for unless the GUI runs
+    from yogaboard.app import KeyboardApp
+
     app = KeyboardApp()
     return app.run(None)
 
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Callable
 
+from gi.repository import GLib
 
-@dataclass
+
+@dataclass(slots=True)
 class TouchpadSettings:
     """Touchpad-related settings."""
 
@@ -18,13 +20,19 @@ class TouchpadSettings:
     tap_drag_window: float = 0.25
 
 
-@dataclass
+@dataclass(slots=True)
 class AppearanceSettings:
     """Appearance-related settings."""
 
     color_scheme: str = "default"
 
 
+# Field names resolved once; save() reads attributes directly rather
+# than paying asdict()'s recursive deepcopy for flat dataclasses
+_TOUCHPAD_FIELDS = tuple(f.name for f in fields(TouchpadSettings))
+_APPEARANCE_FIELDS = tuple(f.name for f in fields(AppearanceSettings))
+
+
 class SettingsManager:
     """Handles loading, saving, and accessing application settings."""
 
@@ -36,6 +44,10 @@ class SettingsManager:
         self.appearance = AppearanceSettings()
         self._config_path: str | None = None
         self._callbacks: list[Callable[[SettingsManager], None]] = []
+        # Writes are coalesced: save() marks dirty and arms one timeout,
+        # so rapid Apply clicks cost a single file rewrite
+        self._dirty = False
+        self._flush_source = 0
 
     def get_config_path(self) -> str:
         """Get XDG-compliant config file path."""
@@ -54,28 +66,54 @@ class SettingsManager:
             try:
                 with open(config_path, "r") as f:
                     data = json.load(f)
-                if "touchpad" in data:
-                    # Only update fields that exist in the file
-                    for key, value in data["touchpad"].items():
-                        if hasattr(self.touchpad, key):
-                            setattr(self.touchpad, key, value)
-                if "appearance" in data:
-                    for key, value in data["appearance"].items():
-                        if hasattr(self.appearance, key):
-                            setattr(self.appearance, key, value)
+                # Only update fields that exist in the file; iterating the
+                # known field names skips hasattr probing of unknown keys
+                touchpad_data = data.get("touchpad")
+                if touchpad_data:
+                    for key in _TOUCHPAD_FIELDS:
+                        if key in touchpad_data:
+                            setattr(self.touchpad, key, touchpad_data[key])
+                appearance_data = data.get("appearance")
+                if appearance_data:
+                    for key in _APPEARANCE_FIELDS:
+                        if key in appearance_data:
+                            setattr(self.appearance, key, appearance_data[key])
             except (json.JSONDecodeError, IOError):
                 # Use defaults on error
                 pass
 
     def save(self):
-        """Save current settings to disk."""
+        """Schedule a save; rapid calls coalesce into one disk write."""
+        self._dirty = True
+        if self._flush_source == 0:
+            self._flush_source = GLib.timeout_add(500, self._flush)
+
+    def flush(self):
+        """Write any pending changes immediately (called on shutdown)."""
+        if self._flush_source != 0:
+            GLib.source_remove(self._flush_source)
+            self._flush_source = 0
+        if self._dirty:
+            self._write()
+
+    def _flush(self):
+        self._flush_source = 0
+        if self._dirty:
+            self._write()
+        return GLib.SOURCE_REMOVE
+
+    def _write(self):
+        """Write current settings to disk."""
+        self._dirty = False
         config_path = self.get_config_path()
         config_dir = os.path.dirname(config_path)
         os.makedirs(config_dir, exist_ok=True)
         with open(config_path, "w") as f:
             json.dump({
-                "touchpad": asdict(self.touchpad),
-                "appearance": asdict(self.appearance),
+                "touchpad": {k: getattr(self.touchpad, k) for k in _TOUCHPAD_FIELDS},
+                "appearance": {
+                    k: getattr(self.appearance, k) for k in _APPEARANCE_FIELDS
+                },
             }, f, indent=2)
 
     def add_change_callback(self, callback: Callable[[SettingsManager], None]):
@@ -84,7 +122,9 @@ class SettingsManager:
 
     def notify_change(self):
         """Notify all observers that settings changed."""
-        for callback in self._callbacks:
+        # Snapshot so a callback registering or removing listeners
+        # mid-dispatch can't perturb this iteration
+        for callback in tuple(self._callbacks):
             callback(self)
 
     def get_available_themes(self) -> list[tuple[str, str]]:
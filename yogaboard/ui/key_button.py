@@ -1,15 +1,33 @@
 """Individual key button widget."""
 
 import gi
+import sys
 
 from yogaboard.layout.parser import Key
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
+# CSS class names shared by the button variants - interned module
+# constants so every construction marshals the same string object
+_CSS_KEYBOARD_KEY = sys.intern("keyboard-key")
+_CSS_SECONDARY_LABEL = sys.intern("secondary-label")
 
-class KeyButton(Gtk.Box):
-    """Box widget representing a single keyboard key."""
+
+def create_key_button(key: Key):
+    """Create the cheapest widget that can render the given key."""
+    if key.secondary_label:
+        return SecondaryLabelKeyButton(key)
+    return KeyButton(key)
+
+
+class KeyButton(Gtk.Label):
+    """Label widget representing a single keyboard key.
+
+    Subclassing Gtk.Label directly (rather than wrapping one in a box)
+    keeps the common key at one widget and one CSS node, which halves the
+    measure/allocate and snapshot work for the bulk of the keyboard.
+    """
 
     def __init__(self, key: Key):
         """
@@ -18,32 +36,39 @@ class KeyButton(Gtk.Box):
         Args:
             key: Key object from layout parser
         """
-        super().__init__(orientation=Gtk.Orientation.VERTICAL)
+        super().__init__(label=key.label)
         self.key = key
 
-        # If there's a secondary label, use an overlay layout
-        if key.secondary_label:
-            self._build_secondary_label_key(key)
-        else:
-            # Just a single label
-            self.label = Gtk.Label(label=key.label)
-            self.label.set_hexpand(True)
-            self.label.set_vexpand(True)
-            self.append(self.label)
+        # Resolve the uinput code once at construction so touch handlers
+        # don't pay for a getattr() lookup on every press/release event.
+        self.is_special = key.key.startswith("SPECIAL_")
+        self.uinput_code = None if self.is_special else key.get_uinput_key()
 
-        self.add_css_class("keyboard-key")
+        # One set_css_classes call: each add_css_class would invalidate the
+        # widget's style separately
+        self.set_css_classes([_CSS_KEYBOARD_KEY, *key.classes])
 
-        for css_class in key.classes:
-            self.add_css_class(css_class)
-
-        # Set minimum width based on key.width multiplier and allow horizontal expansion
-        self.set_size_request(int(60 * key.width), -1)
+        # Minimum width precomputed from the key.width multiplier; allow
+        # horizontal expansion
+        self.set_size_request(key.width_px, -1)
         self.set_hexpand(True)
+        self.set_vexpand(True)
+
+
+class SecondaryLabelKeyButton(Gtk.Overlay):
+    """Key with a secondary label (e.g., shift character) in the top-right.
 
-    def _build_secondary_label_key(self, key: Key):
-        """Build a key with a secondary label (e.g., shift character)."""
-        # Create an overlay to position labels
-        overlay = Gtk.Overlay()
+    The button *is* the overlay - the box that used to wrap it added a
+    widget and CSS node per labeled key without contributing anything to
+    layout, since the overlay already fills the allocation.
+    """
+
+    def __init__(self, key: Key):
+        super().__init__()
+        self.key = key
+
+        self.is_special = key.key.startswith("SPECIAL_")
+        self.uinput_code = None if self.is_special else key.get_uinput_key()
 
         # Primary label (centered)
         self.label = Gtk.Label(label=key.label)
@@ -51,15 +76,20 @@ class KeyButton(Gtk.Box):
         self.label.set_vexpand(True)
         self.label.set_halign(Gtk.Align.CENTER)
         self.label.set_valign(Gtk.Align.CENTER)
-        overlay.set_child(self.label)
+        self.set_child(self.label)
 
         # Secondary label (top-right, smaller)
         self.secondary_label = Gtk.Label(label=key.secondary_label)
         self.secondary_label.set_halign(Gtk.Align.END)
         self.secondary_label.set_valign(Gtk.Align.START)
-        self.secondary_label.add_css_class("secondary-label")
+        self.secondary_label.add_css_class(_CSS_SECONDARY_LABEL)
         self.secondary_label.set_margin_top(4)
         self.secondary_label.set_margin_end(6)
-        overlay.add_overlay(self.secondary_label)
+        self.add_overlay(self.secondary_label)
+
+        # One set_css_classes call: each add_css_class would invalidate the
+        # widget's style separately
+        self.set_css_classes([_CSS_KEYBOARD_KEY, *key.classes])
 
-        self.append(overlay)
+        self.set_size_request(key.width_px, -1)
+        self.set_hexpand(True)
@@ -6,7 +6,7 @@ from yogaboard.layout.parser import Layout, Key
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
-from .key_button import KeyButton
+from .key_button import create_key_button
 
 
 class KeyboardWidget(Gtk.Box):
@@ -26,13 +26,18 @@ class KeyboardWidget(Gtk.Box):
             orientation=Gtk.Orientation.VERTICAL, spacing=self.vertical_spacing
         )
         self.layout = layout
-        self.key_buttons = []
 
         # Add horizontal padding
         self.set_margin_start(10)
         self.set_margin_end(10)
 
-        # Build keyboard grid row by row
+        # Frozen to a tuple: built in one pass, never mutated afterwards
+        self.key_buttons = tuple(self._build_rows(layout))
+
+        self.add_css_class("keyboard-widget")
+
+    def _build_rows(self, layout: Layout):
+        """Build and attach the row boxes, yielding every key button."""
         for row in layout.rows:
             row_box = Gtk.Box(
                 orientation=Gtk.Orientation.HORIZONTAL, spacing=self.horizontal_spacing
@@ -46,7 +51,7 @@ class KeyboardWidget(Gtk.Box):
                     # Create a vertical container for two stacked buttons
                     split_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
                     split_box.set_hexpand(True)
-                    split_box.set_size_request(int(60 * key.width), -1)
+                    split_box.set_size_request(key.width_px, -1)
 
                     # Create Key objects from split keys
                     top_key_obj = Key(
@@ -62,20 +67,18 @@ class KeyboardWidget(Gtk.Box):
                         classes=key.classes,
                     )
 
-                    top_btn = KeyButton(top_key_obj)
-                    bottom_btn = KeyButton(bottom_key_obj)
-
-                    self.key_buttons.append(top_btn)
-                    self.key_buttons.append(bottom_btn)
+                    top_btn = create_key_button(top_key_obj)
+                    bottom_btn = create_key_button(bottom_key_obj)
 
                     split_box.append(top_btn)
                     split_box.append(bottom_btn)
                     row_box.append(split_box)
+
+                    yield top_btn
+                    yield bottom_btn
                 else:
-                    btn = KeyButton(key)
-                    self.key_buttons.append(btn)
+                    btn = create_key_button(key)
                     row_box.append(btn)
+                    yield btn
 
             self.append(row_box)
-
-        self.add_css_class("keyboard-widget")
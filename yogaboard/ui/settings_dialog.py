@@ -9,7 +9,7 @@ gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
 if TYPE_CHECKING:
-    from yogaboard.main import KeyboardApp
+    from yogaboard.app import KeyboardApp
     from yogaboard.settings import SettingsManager
 
 
@@ -39,12 +39,11 @@ class SettingsDialog(Gtk.Window):
         main_box.append(appearance_header)
 
         # Color scheme dropdown
-        scheme_row = self._create_dropdown_row(
+        scheme_row, self.scheme_dropdown = self._create_dropdown_row(
             "Color Scheme",
             options=settings_manager.get_available_themes(),
             current=settings_manager.appearance.color_scheme,
         )
-        self.scheme_dropdown = scheme_row.get_last_child()
         main_box.append(scheme_row)
 
         # Touchpad section header
@@ -53,27 +52,28 @@ class SettingsDialog(Gtk.Window):
         header.set_halign(Gtk.Align.START)
         main_box.append(header)
 
-        # Pointer sensitivity
-        pointer_row = self._create_scale_row(
-            "Pointer Sensitivity",
+        # Both sensitivity sliders share one grid (a label row plus a
+        # scale row each) instead of a wrapper box per slider
+        scale_grid = Gtk.Grid(row_spacing=4)
+        self.pointer_scale = self._add_scale_row(
+            scale_grid,
+            row=0,
+            label="Pointer Sensitivity",
             min_val=0.5,
             max_val=5.0,
             step=0.1,
             current=settings_manager.touchpad.pointer_sensitivity,
         )
-        self.pointer_scale = pointer_row.get_last_child()
-        main_box.append(pointer_row)
-
-        # Scroll sensitivity
-        scroll_row = self._create_scale_row(
-            "Scroll Sensitivity",
+        self.scroll_scale = self._add_scale_row(
+            scale_grid,
+            row=2,
+            label="Scroll Sensitivity",
             min_val=0.05,
             max_val=0.5,
             step=0.01,
             current=settings_manager.touchpad.scroll_sensitivity,
         )
-        self.scroll_scale = scroll_row.get_last_child()
-        main_box.append(scroll_row)
+        main_box.append(scale_grid)
 
         # Tap-and-drag checkbox
         self.tap_drag_check = Gtk.CheckButton(label="Enable tap-and-drag gesture")
@@ -100,28 +100,51 @@ class SettingsDialog(Gtk.Window):
         main_box.append(button_box)
         self.set_child(main_box)
 
-    def _create_scale_row(
-        self, label: str, min_val: float, max_val: float, step: float, current: float
-    ) -> Gtk.Box:
-        """Create a labeled slider row."""
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+        # Hide instead of destroying on close so the widget tree (and its
+        # computed styles) survive and the app can re-present this instance
+        self.connect("close-request", self._on_close_request)
 
+    def refresh(self):
+        """Re-sync control values from the settings manager before re-showing."""
+        touchpad = self.settings_manager.touchpad
+        self.pointer_scale.set_value(touchpad.pointer_sensitivity)
+        self.scroll_scale.set_value(touchpad.scroll_sensitivity)
+        self.tap_drag_check.set_active(touchpad.tap_drag_enabled)
+        try:
+            index = self._scheme_values.index(
+                self.settings_manager.appearance.color_scheme
+            )
+        except ValueError:
+            index = 0
+        self.scheme_dropdown.set_selected(index)
+
+    def _add_scale_row(
+        self,
+        grid: Gtk.Grid,
+        row: int,
+        label: str,
+        min_val: float,
+        max_val: float,
+        step: float,
+        current: float,
+    ) -> Gtk.Scale:
+        """Attach a labeled slider to the shared grid, returning the scale."""
         lbl = Gtk.Label(label=label)
         lbl.set_halign(Gtk.Align.START)
-        box.append(lbl)
+        grid.attach(lbl, 0, row, 1, 1)
 
         scale = Gtk.Scale.new_with_range(Gtk.Orientation.HORIZONTAL, min_val, max_val, step)
         scale.set_value(current)
         scale.set_draw_value(True)
         scale.set_hexpand(True)
-        box.append(scale)
+        grid.attach(scale, 0, row + 1, 1, 1)
 
-        return box
+        return scale
 
     def _create_dropdown_row(
         self, label: str, options: list[tuple[str, str]], current: str
-    ) -> Gtk.Box:
-        """Create a labeled dropdown row."""
+    ) -> tuple[Gtk.Box, Gtk.DropDown]:
+        """Create a labeled dropdown row, returning the row and its dropdown."""
         box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         box.set_margin_top(4)
         box.set_margin_bottom(4)
@@ -148,19 +171,38 @@ class SettingsDialog(Gtk.Window):
             dropdown.set_selected(0)
 
         box.append(dropdown)
-        return box
+        return box, dropdown
 
     def _on_apply(self, button):
         """Save settings and notify handlers."""
-        # Touchpad settings
         touchpad = self.settings_manager.touchpad
+        appearance = self.settings_manager.appearance
+        old = (
+            touchpad.pointer_sensitivity,
+            touchpad.scroll_sensitivity,
+            touchpad.tap_drag_enabled,
+            appearance.color_scheme,
+        )
+
+        # Touchpad settings
         touchpad.pointer_sensitivity = self.pointer_scale.get_value()
         touchpad.scroll_sensitivity = self.scroll_scale.get_value()
         touchpad.tap_drag_enabled = self.tap_drag_check.get_active()
 
         # Appearance settings
         selected_index = self.scheme_dropdown.get_selected()
-        self.settings_manager.appearance.color_scheme = self._scheme_values[selected_index]
+        appearance.color_scheme = self._scheme_values[selected_index]
+
+        # Applying with nothing changed shouldn't rewrite the config or
+        # make every subscriber (theme reload included) reconfigure
+        new = (
+            touchpad.pointer_sensitivity,
+            touchpad.scroll_sensitivity,
+            touchpad.tap_drag_enabled,
+            appearance.color_scheme,
+        )
+        if new == old:
+            return
 
         # Save to disk
         self.settings_manager.save()
@@ -169,5 +211,10 @@ class SettingsDialog(Gtk.Window):
         self.settings_manager.notify_change()
 
     def _on_close(self, button):
-        """Close the dialog."""
-        self.close()
+        """Hide the dialog; the instance is kept for reuse."""
+        self.set_visible(False)
+
+    def _on_close_request(self, window):
+        """Intercept window-manager close so the dialog survives."""
+        self.set_visible(False)
+        return True
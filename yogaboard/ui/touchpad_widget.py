@@ -1,23 +1,37 @@
 """Touchpad widget with touch surface and control buttons."""
 
+import cairo
 import gi
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
+# Background chrome colors and corner-indicator size, shared by every
+# recorded background
+_BG_RGBA = (0.3, 0.35, 0.45, 0.3)
+_CORNER_RGBA = (0.4, 0.45, 0.55, 0.5)
+_INDICATOR_SIZE = 20
+
 
 class TouchpadWidget(Gtk.Box):
     """Widget that provides a virtual touchpad surface with controls."""
 
-    def __init__(self, show_controls=True):
+    def __init__(self, show_controls=True, show_buttons=True):
         """
         Initialize the touchpad widget.
 
         Args:
             show_controls: Whether to show mode/close buttons (False when embedded)
+            show_buttons: Whether to show the mouse button row
         """
         super().__init__(orientation=Gtk.Orientation.VERTICAL, spacing=0)
         self.show_controls = show_controls
+        self.show_buttons = show_buttons
+
+        # The background chrome only depends on the surface size, so it's
+        # recorded once per size and replayed as a single paint on redraws
+        self._bg_cache = None
+        self._bg_size = (0, 0)
 
         # Add padding (less when embedded)
         self.set_margin_start(4)
@@ -38,38 +52,41 @@ class TouchpadWidget(Gtk.Box):
         self.touchpad_area.set_draw_func(self._draw_touchpad)
         self.append(self.touchpad_area)
 
-        # Mouse button row
-        self.button_row = Gtk.Box(
-            orientation=Gtk.Orientation.HORIZONTAL, spacing=2
-        )
-        self.button_row.set_margin_top(2)
-        self.button_row.add_css_class("mouse-button-row")
-
-        # Left click button (using Box like KeyButton for proper press/release)
-        self.left_click_button = Gtk.Box()
-        self.left_click_button.set_hexpand(True)
-        self.left_click_button.set_size_request(-1, 45)
-        self.left_click_button.set_can_target(True)
-        self.left_click_button.add_css_class("mouse-button")
-        self.button_row.append(self.left_click_button)
-
-        # Middle click button
-        self.middle_click_button = Gtk.Box()
-        self.middle_click_button.set_hexpand(True)
-        self.middle_click_button.set_size_request(-1, 45)
-        self.middle_click_button.set_can_target(True)
-        self.middle_click_button.add_css_class("mouse-button")
-        self.button_row.append(self.middle_click_button)
-
-        # Right click button
-        self.right_click_button = Gtk.Box()
-        self.right_click_button.set_hexpand(True)
-        self.right_click_button.set_size_request(-1, 45)
-        self.right_click_button.set_can_target(True)
-        self.right_click_button.add_css_class("mouse-button")
-        self.button_row.append(self.right_click_button)
-
-        self.append(self.button_row)
+        # Mouse button row (skipped entirely when the embedder has its own)
+        self.button_row = None
+        self.left_click_button = None
+        self.middle_click_button = None
+        self.right_click_button = None
+
+        if show_buttons:
+            self.button_row = Gtk.Box(
+                orientation=Gtk.Orientation.HORIZONTAL, spacing=2
+            )
+            self.button_row.set_margin_top(2)
+            self.button_row.add_css_class("mouse-button-row")
+
+            # Left click button (using Box like KeyButton for proper press/release)
+            self.left_click_button = Gtk.Box()
+            self.left_click_button.set_hexpand(True)
+            self.left_click_button.set_can_target(True)
+            self.left_click_button.add_css_class("mouse-button")
+            self.button_row.append(self.left_click_button)
+
+            # Middle click button
+            self.middle_click_button = Gtk.Box()
+            self.middle_click_button.set_hexpand(True)
+            self.middle_click_button.set_can_target(True)
+            self.middle_click_button.add_css_class("mouse-button")
+            self.button_row.append(self.middle_click_button)
+
+            # Right click button
+            self.right_click_button = Gtk.Box()
+            self.right_click_button.set_hexpand(True)
+            self.right_click_button.set_can_target(True)
+            self.right_click_button.add_css_class("mouse-button")
+            self.button_row.append(self.right_click_button)
+
+            self.append(self.button_row)
 
         # Control row at bottom (only if show_controls is True)
         self.mode_button = None
@@ -85,7 +102,6 @@ class TouchpadWidget(Gtk.Box):
             # Mode toggle button
             self.mode_button = Gtk.Button(label="⌨")
             self.mode_button.set_hexpand(True)
-            self.mode_button.set_size_request(-1, 50)
             self.mode_button.add_css_class("keyboard-key")
             self.mode_button.add_css_class("mode")
             self.control_row.append(self.mode_button)
@@ -93,7 +109,6 @@ class TouchpadWidget(Gtk.Box):
             # Close button
             self.close_button = Gtk.Button(label="✕")
             self.close_button.set_hexpand(True)
-            self.close_button.set_size_request(-1, 50)
             self.close_button.add_css_class("keyboard-key")
             self.close_button.add_css_class("close")
             self.control_row.append(self.close_button)
@@ -103,36 +118,54 @@ class TouchpadWidget(Gtk.Box):
         self.add_css_class("touchpad-widget")
 
     def _draw_touchpad(self, area, cr, width, height):
-        """Draw the touchpad surface background."""
-        # Draw a subtle border/indicator
-        cr.set_source_rgba(0.3, 0.35, 0.45, 0.3)
+        """Draw the touchpad surface background from the size-keyed cache."""
+        if (width, height) != self._bg_size:
+            self._bg_cache = self._record_background(width, height)
+            self._bg_size = (width, height)
+
+        cr.set_source_surface(self._bg_cache, 0, 0)
+        cr.paint()
+
+    def _record_background(self, width, height):
+        """Record the static background ops into a replayable surface."""
+        surface = cairo.RecordingSurface(
+            cairo.Content.COLOR_ALPHA, cairo.Rectangle(0, 0, width, height)
+        )
+        cr = cairo.Context(surface)
+
+        # Draw a subtle border/indicator. SOURCE writes the fill without
+        # reading back destination pixels - the rectangle covers the whole
+        # surface, so there is nothing underneath worth blending with.
+        cr.set_operator(cairo.Operator.SOURCE)
+        cr.set_source_rgba(*_BG_RGBA)
         cr.rectangle(0, 0, width, height)
         cr.fill()
+        cr.set_operator(cairo.Operator.OVER)
 
-        # Draw corner indicators
-        cr.set_source_rgba(0.4, 0.45, 0.55, 0.5)
-        indicator_size = 20
+        # Draw corner indicators - four sub-paths, one stroke pass
+        cr.set_source_rgba(*_CORNER_RGBA)
+        indicator_size = _INDICATOR_SIZE
 
         # Top-left corner
         cr.move_to(0, indicator_size)
         cr.line_to(0, 0)
         cr.line_to(indicator_size, 0)
-        cr.stroke()
 
         # Top-right corner
         cr.move_to(width - indicator_size, 0)
         cr.line_to(width, 0)
         cr.line_to(width, indicator_size)
-        cr.stroke()
 
         # Bottom-left corner
         cr.move_to(0, height - indicator_size)
         cr.line_to(0, height)
         cr.line_to(indicator_size, height)
-        cr.stroke()
 
         # Bottom-right corner
         cr.move_to(width - indicator_size, height)
         cr.line_to(width, height)
         cr.line_to(width, height - indicator_size)
+
         cr.stroke()
+
+        return surface
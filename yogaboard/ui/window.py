@@ -11,6 +11,15 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Gtk4LayerShell", "1.0")
 from gi.repository import Gtk, Gtk4LayerShell as LayerShell
 
+# Edges anchored at startup: the keyboard spans the bottom of the screen.
+# TOP starts unanchored and is toggled for full mode.
+_INITIAL_ANCHORS = (
+    (LayerShell.Edge.BOTTOM, True),
+    (LayerShell.Edge.LEFT, True),
+    (LayerShell.Edge.RIGHT, True),
+    (LayerShell.Edge.TOP, False),
+)
+
 
 class KeyboardWindow(Gtk.ApplicationWindow):
     """Main window for the virtual keyboard using layer-shell."""
@@ -23,10 +32,13 @@ class KeyboardWindow(Gtk.ApplicationWindow):
         LayerShell.init_for_window(self)
         LayerShell.set_layer(self, LayerShell.Layer.OVERLAY)
 
-        # Position at bottom of screen
-        LayerShell.set_anchor(self, LayerShell.Edge.BOTTOM, True)
-        LayerShell.set_anchor(self, LayerShell.Edge.LEFT, True)
-        LayerShell.set_anchor(self, LayerShell.Edge.RIGHT, True)
+        # Position at bottom of screen, remembering each edge's state so
+        # later changes only touch edges that actually flip
+        self._anchors = {}
+        for edge, anchored in _INITIAL_ANCHORS:
+            self._anchors[edge] = anchored
+            if anchored:
+                LayerShell.set_anchor(self, edge, anchored)
 
         # Reserve space (exclusive zone) so windows don't overlap keyboard
         LayerShell.auto_exclusive_zone_enable(self)
@@ -38,9 +50,20 @@ class KeyboardWindow(Gtk.ApplicationWindow):
         # Set window size
         self.set_default_size(-1, 400)
 
+    def _set_anchor(self, edge, anchored: bool):
+        """Anchor/unanchor an edge, skipping calls that change nothing.
+
+        Every set_anchor re-enters the layer-shell protocol and costs a
+        Wayland configure round-trip, so no-ops are filtered here.
+        """
+        if self._anchors[edge] == anchored:
+            return
+        self._anchors[edge] = anchored
+        LayerShell.set_anchor(self, edge, anchored)
+
     def toggle_full(self, full: bool):
-        LayerShell.set_anchor(self, LayerShell.Edge.TOP, full)
+        self._set_anchor(LayerShell.Edge.TOP, full)
 
     def _on_close_clicked(self, button):
         """Handle close button click."""
-        self.app.quit()
+        self.app.hide_window()